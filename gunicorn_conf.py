@@ -0,0 +1,49 @@
+"""
+Gunicorn configuration for serving the API.
+
+Run with:
+    gunicorn -c gunicorn_conf.py main:app
+"""
+import asyncio
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# Each worker holds its own database pool, sized by DB_POOL_SIZE and
+# DB_MAX_OVERFLOW; keep the total below Postgres' max_connections
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+# uvicorn picks uvloop and httptools automatically when they are installed
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+timeout = 120
+
+def on_starting(server):
+    """
+    Create the database tables once, in the master, before any worker starts.
+
+    Workers forked from the preloaded app see the tables as created and
+    skip the step in their startup hook.
+    """
+    from src.app.service.db_service import DBService
+
+    async def create_tables():
+        db_service = DBService()
+        try:
+            await db_service.create_tables()
+        finally:
+            await db_service.close()
+
+    asyncio.run(create_tables())
+
+def post_fork(server, worker):
+    """
+    Drop anything holding sockets that was created before the fork.
+
+    boto3 clients and their urllib3 connection pools are not safe to share
+    across processes, so each worker builds its own on first use.
+    """
+    from src.app.service.s3_service import get_s3_client
+    from src.app.api.dependencies import get_document_service
+
+    get_s3_client.cache_clear()
+    get_document_service.cache_clear()
@@ -1,22 +1,44 @@
 from typing import Union
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.app.core.config import settings
+from src.app.core.config import get_settings
+from src.app.api.dependencies import get_document_service
+from src.app.api.middleware import MaxBodySizeMiddleware
 from src.app.api.routes.document import router as document_router
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
+# Configure logging: request code only merges the message and enqueues the
+# record, a background listener thread adds the prefix and writes to stderr
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+log_queue = queue.Queue(-1)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+# QueueHandler.prepare() formats the record into its message before
+# enqueueing; keep that to the bare message so the prefix is added once
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(queue_handler)
+log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
 
 app = FastAPI()
 
+# Reject oversized uploads while the body is received rather than after it
+# is spooled. Added before CORS so the 413 response still gets CORS headers.
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    max_body_size=get_settings().MAX_UPLOAD_SIZE_BYTES
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -27,7 +49,25 @@ app.add_middleware(
 )
 
 # Include API routes
-app.include_router(document_router, prefix=settings.API_PREFIX)
+app.include_router(document_router, prefix=get_settings().API_PREFIX)
+
+@app.on_event("startup")
+def start_log_listener():
+    # Started here rather than at import so each forked worker runs its own
+    log_listener.start()
+
+@app.on_event("startup")
+async def create_tables():
+    await get_document_service().db_service.create_tables()
+
+@app.on_event("shutdown")
+async def close_document_service():
+    await get_document_service().close()
+
+@app.on_event("shutdown")
+def stop_log_listener():
+    # Registered last so records logged by earlier shutdown hooks are flushed
+    log_listener.stop()
 
 @app.get("/health")
 def health_check():
@@ -0,0 +1,15 @@
+"""
+FastAPI dependency providers.
+"""
+from functools import lru_cache
+from src.app.service.document_service import DocumentService
+
+@lru_cache(maxsize=1)
+def get_document_service():
+    """
+    Get the shared document service, creating it on first use.
+    
+    Returns:
+        DocumentService: The document service.
+    """
+    return DocumentService()
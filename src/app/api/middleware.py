@@ -0,0 +1,59 @@
+"""
+ASGI middleware for the API.
+"""
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+
+class MaxBodySizeMiddleware:
+    """
+    Reject request bodies larger than a limit while they are received.
+
+    A declared Content-Length over the limit is answered with 413 straight
+    away. Bodies without one, such as chunked uploads, are counted as they
+    stream in and the request fails with 413 as soon as the count passes
+    the limit, before the rest is read and spooled to disk.
+    """
+    def __init__(self, app, max_body_size):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            max_body_size (int): The maximum request body size in bytes.
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body exceeds the maximum upload size of {self.max_body_size} bytes"
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                content={"detail": detail}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # FastAPI re-raises HTTPExceptions from body parsing, so
+                    # this reaches the client as a 413
+                    raise HTTPException(
+                        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                        detail=detail
+                    )
+            return message
+
+        await self.app(scope, receive_limited, send)
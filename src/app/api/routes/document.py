@@ -2,39 +2,55 @@
 API routes for document operations.
 """
 import logging
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, status
-from src.app.service.document_service import DocumentService
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from src.app.api.dependencies import get_document_service
+from src.app.service.document_service import (
+    DocumentService,
+    FileTooLargeError,
+    UnsupportedFileTypeError
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-document_service = DocumentService()
 
 @router.post("/document", status_code=status.HTTP_200_OK)
 async def upload_document(
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    document_service: DocumentService = Depends(get_document_service)
 ):
     """
-    Upload a document to S3 and process it.
+    Upload a document to S3 and queue it for processing.
     
     Args:
-        background_tasks (BackgroundTasks): FastAPI background tasks.
         file (UploadFile): The file to upload.
+        document_service (DocumentService): The document service.
         
     Returns:
         dict: The document information.
     """
     try:
-        result = await document_service.upload_document(file, background_tasks)
+        result = await document_service.upload_document(file)
         return result
+    except FileTooLargeError as e:
+        logger.error("File too large: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=str(e)
+        )
+    except UnsupportedFileTypeError as e:
+        logger.error("Unsupported file type: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(e)
+        )
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error uploading document: {str(e)}")
+        logger.error("Error uploading document: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while uploading the document"
@@ -1,11 +1,11 @@
 """
 Document model for the application.
 """
-import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
+from src.app.utils.ids import uuid7
 
 Base = declarative_base()
 
@@ -15,7 +15,7 @@ class Document(Base):
     """
     __tablename__ = "documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     filename = Column(String, nullable=False)
     s3_key = Column(String, nullable=False)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
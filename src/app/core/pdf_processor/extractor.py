@@ -2,10 +2,8 @@
 PDF extraction functionality using unstructured library.
 """
 import logging
-import json
 from unstructured.partition.pdf import partition_pdf
 from unstructured.chunking.title import chunk_by_title
-from unstructured.staging.base import elements_from_base64_gzipped_json
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +18,16 @@ def extract_elements_from_pdf(file_path):
         list: List of extracted elements.
     """
     try:
-        logger.info(f"Extracting elements from PDF: {file_path}")
+        logger.info("Extracting elements from PDF: %s", file_path)
         elements = partition_pdf(
             filename=file_path,
             ocr_only=True,
             languages=["eng"]
         )
-        logger.info(f"Extracted {len(elements)} elements from PDF")
+        logger.info("Extracted %d elements from PDF", len(elements))
         return elements
     except Exception as e:
-        logger.error(f"Error extracting elements from PDF: {e}")
+        logger.error("Error extracting elements from PDF: %s", e)
         raise
 
 def chunk_elements_by_title(elements):
@@ -45,25 +43,58 @@ def chunk_elements_by_title(elements):
     try:
         logger.info("Chunking elements by title")
         chunks = chunk_by_title(
-            elements = elements
+            elements=elements
         )
-        logger.info(f"Created {len(chunks)} chunks")
+        logger.info("Created %d chunks", len(chunks))
         return chunks
     except Exception as e:
-        logger.error(f"Error chunking elements: {e}")
+        logger.error("Error chunking elements: %s", e)
         raise
 
-def group_narrative_by_title(chunks):
+def extract_chunk_titles(chunks):
+    """
+    Collect the title texts of each chunk from its original elements.
+    
+    Chunks straight from chunk_elements_by_title hold their original
+    elements in memory, so nothing needs decoding here.
+    
+    Args:
+        chunks (list): List of chunks from chunk_elements_by_title.
+        
+    Returns:
+        list: One list of stripped title texts per chunk.
+    """
+    return [
+        [title for elem in chunk.metadata.orig_elements or []
+         if elem.category == "Title" and (title := elem.text.strip())]
+        for chunk in chunks
+    ]
+
+def group_narrative_by_title(chunks, chunk_titles=None):
+    """
+    Group chunk text into sections headed by the titles they contain.
+    
+    Args:
+        chunks (list): List of chunks from chunk_elements_by_title.
+        chunk_titles (list, optional): Title texts per chunk, as returned by
+            extract_chunk_titles. Computed from the chunks when omitted.
+        
+    Returns:
+        list: List of dicts with title, content and page_numbers.
+    """
+    if chunk_titles is None:
+        chunk_titles = extract_chunk_titles(chunks)
+    
     result = []
     current_titles = []
     current_content = []
-    current_page_numbers = set()
+    current_page_numbers = []
     
     def save_current_group():
         if current_titles or current_content:
             title = " | ".join(current_titles) if current_titles else "Untitled"
             content = " ".join(current_content).strip()
-            page_numbers = sorted(list(current_page_numbers)) if current_page_numbers else []
+            page_numbers = sorted(set(current_page_numbers))
             
             if title or content:  # Only add if there's actual content
                 group = {
@@ -72,45 +103,37 @@ def group_narrative_by_title(chunks):
                     "page_numbers": page_numbers
                 }
 
-                              # Print the group being saved
-                print("="*60)
-                print("SAVING GROUP:")
-                print(f"Title: {title}")
-                print(f"Content: {content}")
-                print(f"Page Numbers: {page_numbers}")
-                print(f"Content Length: {len(content)} characters")
-                print("="*60)
+                logger.debug(
+                    "Saving group: title=%s, page_numbers=%s, content_length=%d",
+                    title, page_numbers, len(content)
+                )
 
                 result.append(group)
     
-    for chunk in chunks:
-        metadata = chunk.metadata.to_dict()
-        page_number = metadata.get("page_number")
+    for chunk, titles in zip(chunks, chunk_titles):
+        page_number = getattr(chunk.metadata, "page_number", None)
         chunk_text = chunk.text.strip()
         
         if not chunk_text:
             continue
             
-        # Add page number for this chunk
-        if page_number is not None:
-            current_page_numbers.add(page_number)
-        
-        orig_elements = elements_from_base64_gzipped_json(metadata["orig_elements"])
-        
-        # Check if this chunk contains any titles
-        chunk_titles = [elem.text.strip() for elem in orig_elements 
-                       if elem.category == "Title" and elem.text.strip()]
+        # Add page number for this chunk; pages mostly arrive in order, so
+        # only the last one needs checking for duplicates
+        if page_number is not None and (
+            not current_page_numbers or current_page_numbers[-1] != page_number
+        ):
+            current_page_numbers.append(page_number)
         
-        if chunk_titles:
+        if titles:
             if current_content:
                 # Save current group when we have content
                 save_current_group()
-                current_titles = chunk_titles
+                current_titles = list(titles)
                 current_content = [chunk_text]
-                current_page_numbers = {page_number} if page_number is not None else set()
+                current_page_numbers = [page_number] if page_number is not None else []
             else:
                 # Accumulate consecutive titles
-                current_titles.extend(chunk_titles)
+                current_titles.extend(titles)
                 current_content = [chunk_text]
         else:
             # No titles in this chunk, add text to current content
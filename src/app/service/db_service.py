@@ -2,42 +2,69 @@
 Service for handling database operations.
 """
 import logging
-import uuid
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from src.app.core.config import settings
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.app.core.config import get_settings
 from src.app.core.models.document import Base, Document
+from src.app.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
+# Arbitrary key for the advisory lock that serializes table creation
+_CREATE_TABLES_LOCK_KEY = 7_318_036
+# Set once this process (or the gunicorn master it was forked from) has
+# created the tables
+_tables_created = False
+
 class DBService:
     """
     Service for handling database operations.
     """
     def __init__(self):
         """
-        Initialize the database connection.
+        Initialize the database connection pool.
+        """
+        self.engine = create_async_engine(
+            get_settings().DATABASE_URL,
+            pool_size=get_settings().DB_POOL_SIZE,
+            max_overflow=get_settings().DB_MAX_OVERFLOW,
+            pool_pre_ping=True
+        )
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+    
+    async def create_tables(self):
         """
-        self.engine = create_engine(settings.DATABASE_URL)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        Create tables if they don't exist.
         
-        # Create tables if they don't exist
-        Base.metadata.create_all(bind=self.engine)
+        Concurrent callers, such as several workers starting at once, would
+        race on creating the same types, so they take turns under a
+        transaction-level advisory lock.
+        """
+        global _tables_created
+        if _tables_created:
+            return
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {"key": _CREATE_TABLES_LOCK_KEY}
+            )
+            await conn.run_sync(Base.metadata.create_all)
+        _tables_created = True
+    
+    async def close(self):
+        """
+        Close all pooled database connections.
+        """
+        await self.engine.dispose()
     
     def get_session(self):
         """
         Get a database session.
         
         Returns:
-            Session: A SQLAlchemy session.
+            AsyncSession: A SQLAlchemy async session.
         """
-        session = self.SessionLocal()
-        try:
-            return session
-        except Exception as e:
-            session.close()
-            logger.error(f"Error getting database session: {e}")
-            raise
+        return self.SessionLocal()
     
     async def create_document(self, filename, s3_key):
         """
@@ -50,22 +77,23 @@ class DBService:
         Returns:
             Document: The created document.
         """
-        session = self.get_session()
         try:
-            document_id = uuid.uuid4()
+            stmt = (
+                insert(Document)
+                .values(id=uuid7(), filename=filename, s3_key=s3_key)
+                .returning(Document.id, Document.uploaded_at)
+            )
+            async with self.get_session() as session:
+                async with session.begin():
+                    row = (await session.execute(stmt)).one()
             document = Document(
-                id=document_id,
+                id=row.id,
                 filename=filename,
-                s3_key=s3_key
+                s3_key=s3_key,
+                uploaded_at=row.uploaded_at
             )
-            session.add(document)
-            session.commit()
-            session.refresh(document)
-            logger.info(f"Document created with ID: {document.id}")
+            logger.info("Document created with ID: %s", document.id)
             return document
         except Exception as e:
-            session.rollback()
-            logger.error(f"Error creating document: {e}")
+            logger.error("Error creating document: %s", e)
             raise
-        finally:
-            session.close()
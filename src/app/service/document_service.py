@@ -3,77 +3,141 @@ Service for handling document operations.
 """
 import logging
 import json
-import uuid
+import os
+import shutil
 import tempfile
-from fastapi import UploadFile, BackgroundTasks
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from src.app.core.config import get_settings
 from src.app.service.s3_service import S3Service
 from src.app.service.db_service import DBService
-from src.app.core.pdf_processor.extractor import (
-    extract_elements_from_pdf,
-    chunk_elements_by_title,
-    group_narrative_by_title
-)
+from src.app.tasks import process_document
+from src.app.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
+PDF_MAGIC = b"%PDF-"
+
+def copy_to_temp_file(fileobj, suffix='.pdf'):
+    """
+    Copy a file-like object to a named temporary file in 1 MB chunks.
+    
+    Args:
+        fileobj: A readable file-like object opened in binary mode.
+        suffix (str): The suffix for the temporary file name.
+        
+    Returns:
+        str: The path of the temporary file; the caller must remove it.
+    """
+    temp_file = tempfile.NamedTemporaryFile(
+        delete=False, suffix=suffix, dir=get_settings().TEMP_FILE_DIR
+    )
+    try:
+        with temp_file:
+            shutil.copyfileobj(fileobj, temp_file, length=1024 * 1024)
+    except Exception:
+        # The caller never gets the path, so remove the partial copy here
+        os.remove(temp_file.name)
+        raise
+    return temp_file.name
+
+class UnsupportedFileTypeError(ValueError):
+    """
+    Raised when an uploaded file is not a PDF.
+    """
+
+class FileTooLargeError(ValueError):
+    """
+    Raised when an uploaded file exceeds the maximum upload size.
+    """
+
 class DocumentService:
     """
     Service for handling document operations.
     """
-    def __init__(self):
+    def __init__(self, s3_service=None, db_service=None):
         """
         Initialize the document service.
+        
+        Args:
+            s3_service (S3Service): The S3 service to use (optional).
+            db_service (DBService): The database service to use (optional).
+        """
+        # Only client uploads go through Transfer Acceleration; workers
+        # download from the bucket's own region
+        self.s3_service = s3_service or S3Service(
+            accelerate=get_settings().AWS_S3_USE_ACCELERATION
+        )
+        self.db_service = db_service or DBService()
+    
+    async def close(self):
+        """
+        Release the database and S3 connection pools.
         """
-        self.s3_service = S3Service()
-        self.db_service = DBService()
+        await self.db_service.close()
+        self.s3_service.s3_client.close()
     
-    async def process_pdf_file(self, file_path):
+    async def is_pdf(self, file: UploadFile):
         """
-        Process a PDF file using unstructured library.
+        Check that an upload is a PDF by its extension and magic bytes.
         
         Args:
-            file_path (str): Path to the PDF file.
+            file (UploadFile): The uploaded file.
+            
+        Returns:
+            bool: True if the file looks like a PDF.
         """
-        try:
-            logger.info(f"Processing PDF file: {file_path}")
-            elements = extract_elements_from_pdf(file_path)
-            logger.info(f"Sample Element {elements[0]}")
-            chunks = chunk_elements_by_title(elements)
-            group_narrative_by_title(chunks)
-        except Exception as e:
-            logger.error(f"Error processing PDF file: {e}")
+        if not file.filename or file.filename[-4:].lower() != ".pdf":
+            return False
+        
+        head = await file.read(len(PDF_MAGIC))
+        await file.seek(0)
+        return head == PDF_MAGIC
     
-    async def upload_document(self, file: UploadFile, background_tasks: BackgroundTasks):
+    async def upload_document(self, file: UploadFile):
         """
-        Upload a document to S3 and create a database record.
+        Upload a document to S3, create a database record and queue it for processing.
         
         Args:
             file (UploadFile): The uploaded file.
-            background_tasks (BackgroundTasks): FastAPI background tasks.
             
         Returns:
             dict: The document information.
             
         Raises:
-            ValueError: If the file is not a PDF.
+            FileTooLargeError: If the file exceeds the maximum upload size.
+            UnsupportedFileTypeError: If the file is not a PDF.
         """
-        # Validate file type
-        if not file.filename.lower().endswith('.pdf'):
-            raise ValueError("Only PDF files are allowed")
+        # MaxBodySizeMiddleware enforces the limit while the request body is
+        # received; this covers callers that don't go through it
+        max_size = get_settings().MAX_UPLOAD_SIZE_BYTES
+        if file.size is not None and file.size > max_size:
+            raise FileTooLargeError(f"File exceeds the maximum upload size of {max_size} bytes")
+        
+        # Validate file type before any upload or processing work
+        if not await self.is_pdf(file):
+            raise UnsupportedFileTypeError("Only PDF files are allowed")
         
         try:
             # Generate a unique filename
-            file_content = await file.read()
-            unique_id = str(uuid.uuid4())
+            unique_id = str(uuid7())
             original_filename = file.filename
             s3_key = f"documents/{unique_id}/{original_filename}"
             
-            # Upload to S3
-            await self.s3_service.upload_file(
-                file_content=file_content,
-                file_name=s3_key,
-                content_type="application/pdf"
-            )
+            # Copy the spooled upload to a named file so the transfer manager
+            # can read each multipart part from disk rather than buffering
+            # parts in memory; both steps run off the event loop
+            await file.seek(0)
+            temp_file_path = await run_in_threadpool(copy_to_temp_file, file.file)
+            try:
+                await run_in_threadpool(
+                    self.s3_service.upload_file_from_path,
+                    file_path=temp_file_path,
+                    file_name=s3_key,
+                    content_type="application/pdf"
+                )
+            finally:
+                await run_in_threadpool(os.remove, temp_file_path)
             
             # Create database record
             document = await self.db_service.create_document(
@@ -81,19 +145,16 @@ class DocumentService:
                 s3_key=s3_key
             )
             
-            # Process PDF in background
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
-            
-            background_tasks.add_task(self.process_pdf_file, temp_file_path)
+            # Process PDF on a Celery worker; publishing talks to the broker
+            task = await run_in_threadpool(process_document, s3_key)
             
             return {
                 "id": str(document.id),
+                "job_id": task.id,
                 "filename": document.filename,
                 "s3_key": document.s3_key,
                 "uploaded_at": document.uploaded_at.isoformat()
             }
         except Exception as e:
-            logger.error(f"Error uploading document: {e}")
+            logger.error("Error uploading document: %s", e)
             raise
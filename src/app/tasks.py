@@ -0,0 +1,189 @@
+"""
+Celery application and tasks for background document processing.
+
+Documents go through a chain of tasks so each stage can scale on its own:
+OCR runs on the "ocr" queue, chunking and grouping on the "documents" queue.
+
+Run the workers with:
+    celery -A src.app.tasks worker -Q ocr --pool=prefork --concurrency=$(nproc) --max-tasks-per-child=20
+    celery -A src.app.tasks worker -Q documents --pool=prefork --concurrency=$(nproc)
+"""
+import logging
+import os
+import tempfile
+from functools import partial
+import orjson
+from celery import Celery, chain, states
+from kombu.serialization import register
+from unstructured.staging.base import elements_to_dicts, elements_from_dicts
+from src.app.core.config import get_settings
+from src.app.service.s3_service import S3Service
+from src.app.core.pdf_processor.extractor import (
+    extract_elements_from_pdf,
+    chunk_elements_by_title,
+    extract_chunk_titles,
+    group_narrative_by_title
+)
+
+logger = logging.getLogger(__name__)
+
+# Element lists passed between tasks can run to tens of MB, so encode them
+# with orjson rather than the stdlib json serializer. OCR element
+# coordinates are numpy scalars, which orjson only accepts with
+# OPT_SERIALIZE_NUMPY.
+register(
+    "orjson",
+    partial(
+        orjson.dumps,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ),
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary"
+)
+
+celery_app = Celery(
+    "orbit",
+    broker=get_settings().CELERY_BROKER_URL,
+    backend=get_settings().CELERY_RESULT_BACKEND
+)
+celery_app.conf.update(
+    task_default_queue="documents",
+    task_serializer="orjson",
+    result_serializer="orjson",
+    accept_content=["orjson", "json"],
+    # Acknowledge only once a document has been processed and hand out one
+    # task at a time, so a slow document doesn't hold queued ones hostage.
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    result_expires=get_settings().CELERY_RESULT_EXPIRES_SECONDS,
+)
+
+def attempt_started(task):
+    """
+    Check whether the current attempt of a task was started before.
+    
+    Args:
+        task (Task): The bound task, while it is running.
+        
+    Returns:
+        bool: True if the attempt left a STARTED marker in the result backend.
+    """
+    meta = task.backend.get_task_meta(task.request.id)
+    return (
+        meta["status"] == states.STARTED
+        and (meta["result"] or {}).get("retries") == task.request.retries
+    )
+
+@celery_app.task(
+    name="ocr.extract",
+    queue="ocr",
+    bind=True,
+    # The chain hands each result to the next task in its message, so
+    # intermediate element lists stay out of the result backend
+    ignore_result=True,
+    # Requeue the document if its worker process dies mid-run, e.g. when
+    # OCR is killed for running out of memory
+    reject_on_worker_lost=True,
+    max_retries=2
+)
+def extract_elements_task(self, s3_key):
+    """
+    Download a PDF from S3 and extract its elements with OCR.
+    
+    Each attempt records a STARTED marker in the result backend before any
+    work. The broker flags every message it restores as redelivered,
+    including ones never run before a shutdown, reconnect or visibility
+    timeout, so only a redelivered attempt that had already started counts
+    as a lost worker. It is re-sent as a retry straight away; a document
+    that keeps killing its worker then fails after max_retries rather than
+    looping.
+    
+    Args:
+        s3_key (str): The S3 key where the PDF is stored.
+        
+    Returns:
+        list: The extracted elements as dicts.
+    """
+    if (self.request.delivery_info or {}).get("redelivered") and attempt_started(self):
+        logger.warning(
+            "Worker was lost while processing %s, retry %d of %d",
+            s3_key, self.request.retries + 1, self.max_retries
+        )
+        raise self.retry(countdown=0)
+
+    self.backend.store_result(
+        self.request.id,
+        {"retries": self.request.retries},
+        states.STARTED,
+        request=self.request
+    )
+    try:
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix='.pdf', dir=get_settings().TEMP_FILE_DIR
+        ) as temp_file:
+            temp_file_path = temp_file.name
+
+        try:
+            S3Service().download_file(s3_key, temp_file_path)
+            logger.info("Processing PDF file: %s", temp_file_path)
+            elements = extract_elements_from_pdf(temp_file_path)
+            return elements_to_dicts(elements)
+        finally:
+            os.remove(temp_file_path)
+    finally:
+        # Only a worker dying mid-run leaves the marker behind
+        self.backend.forget(self.request.id)
+
+@celery_app.task(name="chunk_elements", ignore_result=True)
+def chunk_elements_task(element_dicts):
+    """
+    Chunk extracted elements by title.
+    
+    Args:
+        element_dicts (list): The extracted elements as dicts.
+        
+    Returns:
+        dict: The chunks as dicts and the title texts of each chunk.
+    """
+    elements = elements_from_dicts(element_dicts)
+    chunks = chunk_elements_by_title(elements)
+    chunk_titles = extract_chunk_titles(chunks)
+    # Titles are all group_narrative_task needs from the original elements,
+    # so drop them rather than base64-encode them into the payload
+    for chunk in chunks:
+        chunk.metadata.orig_elements = None
+    return {
+        "chunks": elements_to_dicts(chunks),
+        "chunk_titles": chunk_titles
+    }
+
+@celery_app.task(name="group_narrative")
+def group_narrative_task(chunked):
+    """
+    Group chunks into titled sections.
+    
+    Args:
+        chunked (dict): The output of chunk_elements_task.
+        
+    Returns:
+        list: List of dicts with title, content and page_numbers.
+    """
+    chunks = elements_from_dicts(chunked["chunks"])
+    return group_narrative_by_title(chunks, chunked["chunk_titles"])
+
+def process_document(s3_key):
+    """
+    Queue the processing pipeline for a document.
+    
+    Args:
+        s3_key (str): The S3 key where the PDF is stored.
+        
+    Returns:
+        AsyncResult: The result of the final task in the pipeline.
+    """
+    return chain(
+        extract_elements_task.s(s3_key),
+        chunk_elements_task.s(),
+        group_narrative_task.s()
+    ).apply_async()
@@ -0,0 +1,28 @@
+"""
+Identifier generation helpers.
+"""
+import os
+import time
+import uuid
+
+def uuid7():
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The first 48 bits are the Unix timestamp in milliseconds, so new ids sort
+    after older ones and land at the tail of a B-tree index instead of at
+    random positions. The remaining bits are random.
+    
+    Returns:
+        uuid.UUID: The generated UUID.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                         # version
+        | (rand >> 68) << 64                # 12 random bits
+        | 0b10 << 62                        # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF      # 62 random bits
+    )
+    return uuid.UUID(int=value)
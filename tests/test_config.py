@@ -0,0 +1,22 @@
+"""
+Tests for the application settings.
+"""
+import pytest
+
+from src.app.core.config import Settings
+
+@pytest.mark.parametrize("url", [
+    "postgresql://user:secret@db:5432/document_db",
+    "postgres://user:secret@db:5432/document_db",
+    "postgresql+psycopg2://user:secret@db:5432/document_db",
+    "postgresql+asyncpg://user:secret@db:5432/document_db",
+])
+def test_database_url_uses_asyncpg(monkeypatch, url):
+    monkeypatch.setenv("DATABASE_URL", url)
+
+    assert Settings().DATABASE_URL == "postgresql+asyncpg://user:secret@db:5432/document_db"
+
+def test_database_url_keeps_other_drivers(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///documents.db")
+
+    assert Settings().DATABASE_URL == "sqlite+aiosqlite:///documents.db"
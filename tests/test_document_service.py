@@ -0,0 +1,54 @@
+"""
+Tests for the document service helpers.
+"""
+import io
+import tempfile
+
+import pytest
+
+from src.app.core.config import get_settings
+from src.app.service.document_service import DocumentService, copy_to_temp_file
+from src.app.service.s3_service import S3Service
+
+class FailingReader(io.RawIOBase):
+    """
+    A stream that fails after returning its first read.
+    """
+    def __init__(self):
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        self.reads += 1
+        if self.reads > 1:
+            raise OSError("connection reset")
+        buffer[:4] = b"%PDF"
+        return 4
+
+@pytest.fixture
+def temp_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+def test_copy_to_temp_file_copies_content(temp_dir):
+    path = copy_to_temp_file(io.BytesIO(b"%PDF-1.4 content"))
+
+    with open(path, "rb") as copied:
+        assert copied.read() == b"%PDF-1.4 content"
+
+def test_copy_to_temp_file_removes_partial_copy_on_error(temp_dir):
+    with pytest.raises(OSError, match="connection reset"):
+        copy_to_temp_file(io.BufferedReader(FailingReader()))
+
+    assert list(temp_dir.iterdir()) == []
+
+def test_only_upload_client_uses_transfer_acceleration(monkeypatch):
+    monkeypatch.setattr(get_settings(), "AWS_S3_USE_ACCELERATION", True)
+
+    upload_client = DocumentService(db_service=object()).s3_service.s3_client
+    worker_client = S3Service().s3_client
+
+    assert upload_client.meta.config.s3["use_accelerate_endpoint"] is True
+    assert not (worker_client.meta.config.s3 or {}).get("use_accelerate_endpoint")
@@ -0,0 +1,98 @@
+"""
+Tests for grouping chunk text by title.
+"""
+import pytest
+from unstructured.chunking.base import CHUNK_MAX_CHARS_DEFAULT
+from unstructured.documents.elements import ElementMetadata, NarrativeText, Title
+from unstructured.staging.base import elements_from_base64_gzipped_json
+
+from src.app.core.pdf_processor.extractor import (
+    chunk_elements_by_title,
+    group_narrative_by_title,
+)
+from src.app.tasks import chunk_elements_task, group_narrative_task
+
+def baseline_group_narrative_by_title(chunks):
+    """
+    The original implementation, which decodes each chunk's orig_elements.
+    """
+    result = []
+    current_titles = []
+    current_content = []
+    current_page_numbers = set()
+
+    def save_current_group():
+        if current_titles or current_content:
+            title = " | ".join(current_titles) if current_titles else "Untitled"
+            content = " ".join(current_content).strip()
+            page_numbers = sorted(list(current_page_numbers)) if current_page_numbers else []
+            if title or content:
+                result.append({"title": title, "content": content, "page_numbers": page_numbers})
+
+    for chunk in chunks:
+        metadata = chunk.metadata.to_dict()
+        page_number = metadata.get("page_number")
+        chunk_text = chunk.text.strip()
+        if not chunk_text:
+            continue
+        if page_number is not None:
+            current_page_numbers.add(page_number)
+        orig_elements = elements_from_base64_gzipped_json(metadata["orig_elements"])
+        chunk_titles = [elem.text.strip() for elem in orig_elements
+                        if elem.category == "Title" and elem.text.strip()]
+        if chunk_titles:
+            if current_content:
+                save_current_group()
+                current_titles = chunk_titles
+                current_content = [chunk_text]
+                current_page_numbers = {page_number} if page_number is not None else set()
+            else:
+                current_titles.extend(chunk_titles)
+                current_content = [chunk_text]
+        else:
+            current_content.append(chunk_text)
+
+    save_current_group()
+    return result
+
+def on_page(element, page_number):
+    element.metadata = ElementMetadata(page_number=page_number)
+    return element
+
+def make_elements():
+    long_text = "Lorem ipsum dolor sit amet. " * (CHUNK_MAX_CHARS_DEFAULT // 20)
+    return [
+        on_page(NarrativeText("Preamble before any title."), 1),
+        # Multi-line and double-spaced titles are whitespace-normalized in chunk text
+        on_page(Title("Chapter 1\nGetting Started"), 1),
+        on_page(NarrativeText("First chapter body."), 1),
+        on_page(Title("Setup  and  Configuration"), 2),
+        on_page(NarrativeText("Overview"), 2),
+        on_page(Title("Overview"), 3),
+        # Narrative text matching a title string must not count as a title
+        on_page(NarrativeText("Overview"), 3),
+        on_page(NarrativeText(long_text), 3),
+        on_page(NarrativeText("Continued on the next page."), 4),
+        on_page(Title("Appendix"), 5),
+        on_page(Title("Glossary"), 5),
+        on_page(NarrativeText("Terms."), 5),
+    ]
+
+@pytest.fixture
+def chunks():
+    return chunk_elements_by_title(make_elements())
+
+def test_group_narrative_matches_baseline(chunks):
+    expected = baseline_group_narrative_by_title(chunks)
+
+    assert expected
+    assert group_narrative_by_title(chunks) == expected
+
+def test_group_narrative_tasks_match_baseline(chunks):
+    expected = baseline_group_narrative_by_title(chunks)
+    element_dicts = [element.to_dict() for element in make_elements()]
+
+    chunked = chunk_elements_task.run(element_dicts)
+
+    assert all("orig_elements" not in chunk["metadata"] for chunk in chunked["chunks"])
+    assert group_narrative_task.run(chunked) == expected
@@ -0,0 +1,95 @@
+"""
+Tests for the request body size limit.
+"""
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from src.app.api.middleware import MaxBodySizeMiddleware
+
+MAX_BODY_SIZE = 64 * 1024
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(MaxBodySizeMiddleware, max_body_size=MAX_BODY_SIZE)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    return TestClient(app)
+
+def multipart_body(size, boundary="boundary"):
+    return (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="doc.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + b"x" * size + f"\r\n--{boundary}--\r\n".encode()
+
+def test_accepts_body_under_limit(client):
+    response = client.post("/upload", files={"file": ("doc.pdf", b"x" * 1024)})
+
+    assert response.status_code == 200
+    assert response.json() == {"size": 1024}
+
+def test_rejects_declared_content_length_over_limit(client):
+    response = client.post("/upload", files={"file": ("doc.pdf", b"x" * (MAX_BODY_SIZE + 1))})
+
+    assert response.status_code == 413
+
+def test_rejects_chunked_body_over_limit(client):
+    body = multipart_body(4 * MAX_BODY_SIZE)
+
+    def chunks():
+        for start in range(0, len(body), 8 * 1024):
+            yield body[start:start + 8 * 1024]
+
+    response = client.post(
+        "/upload",
+        content=chunks(),
+        headers={"Content-Type": "multipart/form-data; boundary=boundary"}
+    )
+
+    assert response.status_code == 413
+
+@pytest.mark.anyio
+async def test_stops_reading_body_once_over_limit(client):
+    body = multipart_body(4 * MAX_BODY_SIZE)
+    chunk_size = 8 * 1024
+    messages = [
+        {
+            "type": "http.request",
+            "body": body[start:start + chunk_size],
+            "more_body": start + chunk_size < len(body),
+        }
+        for start in range(0, len(body), chunk_size)
+    ]
+    received = []
+    sent = []
+
+    async def receive():
+        received.append(messages[len(received)])
+        return received[-1]
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/upload",
+        "raw_path": b"/upload",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"multipart/form-data; boundary=boundary")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    await client.app(scope, receive, send)
+
+    assert sent[0]["status"] == 413
+    assert len(received) * chunk_size <= MAX_BODY_SIZE + chunk_size
@@ -0,0 +1,164 @@
+"""
+Tests for the Celery tasks and their payload serializer.
+"""
+import json
+import shutil
+
+import numpy as np
+import pytest
+from celery import states
+from celery.backends.cache import CacheBackend
+from celery.exceptions import MaxRetriesExceededError, Retry
+from kombu.serialization import dumps, loads
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import (
+    CoordinatesMetadata,
+    ElementMetadata,
+    NarrativeText,
+    Title,
+)
+from unstructured.staging.base import elements_to_dicts
+
+from src.app.core.pdf_processor.extractor import extract_elements_from_pdf
+from src.app.tasks import celery_app, extract_elements_task
+
+def round_trip(payload):
+    content_type, content_encoding, data = dumps(payload, serializer="orjson")
+    return loads(data, content_type, content_encoding)
+
+def write_pdf(path, lines):
+    """
+    Write a single-page PDF with one line of Helvetica text per entry.
+    """
+    text_ops = " ".join(
+        f"BT /F1 24 Tf 72 {720 - 40 * i} Td ({line}) Tj ET"
+        for i, line in enumerate(lines)
+    ).encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(text_ops), text_ops),
+    ]
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref_offset = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref_offset
+    )
+    path.write_bytes(body)
+
+def test_serializer_handles_numpy_coordinates():
+    # OCR elements carry numpy.float64 coordinates
+    coordinates = CoordinatesMetadata(
+        points=(
+            (np.float64(10.5), np.float64(20.25)),
+            (np.float64(10.5), np.float64(40.0)),
+            (np.float64(200.0), np.float64(40.0)),
+            (np.float64(200.0), np.float64(20.25)),
+        ),
+        system=PixelSpace(width=1700, height=2200),
+    )
+    elements = [
+        Title("Chapter 1", metadata=ElementMetadata(coordinates=coordinates, page_number=1)),
+        NarrativeText("Body text.", metadata=ElementMetadata(coordinates=coordinates, page_number=1)),
+    ]
+    payload = elements_to_dicts(elements)
+
+    assert round_trip(payload) == json.loads(json.dumps(payload))
+
+@pytest.mark.skipif(
+    shutil.which("tesseract") is None or shutil.which("pdftoppm") is None,
+    reason="partition_pdf OCR needs tesseract and poppler",
+)
+def test_serializer_round_trips_partition_pdf_elements(tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    write_pdf(pdf_path, ["Introduction", "This document is processed with OCR."])
+    payload = elements_to_dicts(extract_elements_from_pdf(str(pdf_path)))
+
+    assert payload
+    assert round_trip(payload) == json.loads(json.dumps(payload))
+
+class DownloadReached(Exception):
+    """
+    Raised by FakeS3Service once the task gets as far as downloading.
+    """
+
+class FakeS3Service:
+    """
+    Records the task's STARTED marker at download time, then stops the task.
+    """
+    states = []
+
+    def download_file(self, file_name, file_path):
+        meta = extract_elements_task.backend.get_task_meta(extract_elements_task.request.id)
+        self.states.append(meta["status"])
+        raise DownloadReached(file_name)
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = CacheBackend(app=celery_app, backend="memory")
+    monkeypatch.setattr(extract_elements_task, "backend", backend)
+    monkeypatch.setattr("src.app.tasks.S3Service", FakeS3Service)
+    FakeS3Service.states = []
+    yield backend
+    backend.forget("extract-task-id")
+
+def run_extract(retries=0, redelivered=True):
+    # is_eager keeps retry() from publishing, so it only raises Retry
+    extract_elements_task.push_request(
+        id="extract-task-id",
+        called_directly=False,
+        is_eager=True,
+        delivery_info={"redelivered": redelivered},
+        retries=retries
+    )
+    try:
+        return extract_elements_task.run("documents/a.pdf")
+    finally:
+        extract_elements_task.pop_request()
+
+def test_extraction_marks_attempt_started_then_clears_it(backend):
+    with pytest.raises(DownloadReached):
+        run_extract(redelivered=False)
+
+    assert FakeS3Service.states == [states.STARTED]
+    assert backend.get_state("extract-task-id") == states.PENDING
+
+def test_redelivered_extraction_that_never_started_runs(backend):
+    # Restored on shutdown or reconnect before any worker ran it
+    with pytest.raises(DownloadReached):
+        run_extract()
+
+    assert FakeS3Service.states == [states.STARTED]
+
+def test_redelivered_extraction_after_earlier_attempt_runs(backend):
+    # A marker left by the attempt before this retry doesn't count
+    backend.store_result("extract-task-id", {"retries": 0}, states.STARTED)
+
+    with pytest.raises(DownloadReached):
+        run_extract(retries=1)
+
+def test_redelivered_extraction_that_started_is_retried_immediately(backend):
+    backend.store_result("extract-task-id", {"retries": 0}, states.STARTED)
+
+    with pytest.raises(Retry) as excinfo:
+        run_extract()
+
+    assert excinfo.value.when == 0
+    assert FakeS3Service.states == []
+
+def test_redelivered_extraction_fails_after_max_retries(backend):
+    # Requeued after its worker died on the final retry
+    retries = extract_elements_task.max_retries
+    backend.store_result("extract-task-id", {"retries": retries}, states.STARTED)
+
+    with pytest.raises(MaxRetriesExceededError):
+        run_extract(retries=retries)